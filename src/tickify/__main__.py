@@ -12,7 +12,7 @@ from rich.table import Table
 import typer
 
 from tickify.db import config, models
-from tickify.pomodoro import crud
+from tickify.pomodoro import crud, telemetry
 from tickify.pomodoro.pomodoro import Pomodoro
 
 models.Base.metadata.create_all(bind=config.engine)
@@ -113,6 +113,11 @@ def display_program_options():
             "option": "Show Today's Statistics",
             "description": "View the statistics of all pomodoro sessions today",
         },
+        {
+            "number": "4",
+            "option": "Focus Telemetry",
+            "description": "View the pauses and timer drift of a pomodoro's phases",
+        },
     ]
 
     for option in options:
@@ -147,6 +152,12 @@ def start_new_pomodoro_instance():
     round_time = int(round_time_option[0])
     short_break = int(short_break_option[0])
     long_break = int(long_break_option[0])
+    print()
+
+    record_telemetry = (
+        console.input("[bold yellow]Record focus telemetry? (y/n): ").strip().lower()
+        == "y"
+    )
 
     # Instantiate pomodoro
     pomodoro = Pomodoro(
@@ -155,6 +166,7 @@ def start_new_pomodoro_instance():
         session_minutes=round_time,
         short_break_minutes=short_break,
         long_break_minutes=long_break,
+        record_telemetry=record_telemetry,
     )
 
     print()
@@ -181,6 +193,7 @@ def show_all_statistics():
 
     table = Table(title="All Records", title_style="bold green")
 
+    table.add_column("ID", style="bold yellow")
     table.add_column("Started", style="bold")
     table.add_column("Ended", style="bold")
     table.add_column("Sessions", style="bold blue")
@@ -192,6 +205,7 @@ def show_all_statistics():
 
     for record in all_records:
         table.add_row(
+            str(record.id),
             str(record.started),
             str(record.ended),
             str(record.number_of_sessions),
@@ -256,6 +270,60 @@ def show_today_statistics():
     print()
 
 
+def show_phase_telemetry():
+    pomodoro_id = int(console.input("[bold yellow]Pomodoro ID, see All Statistics: "))
+    records = crud.get_phase_telemetry(pomodoro_id)
+
+    table = Table(
+        title=f"Focus Telemetry for Pomodoro {pomodoro_id}", title_style="bold green"
+    )
+
+    table.add_column("Phase", style="bold")
+    table.add_column("Started", style="bold")
+    table.add_column("Ticks", style="bold blue")
+    table.add_column("Pauses", style="bold")
+    table.add_column("Time Paused")
+    table.add_column("Drift")
+    table.add_column("Ended By", style="bold green")
+
+    for record in records:
+        pauses = 0
+        paused_milliseconds = 0
+        paused_at = None
+        ended_by = "completed"
+
+        for offset, event in telemetry.iter_events(record.events):
+            if event == "pause":
+                pauses += 1
+                paused_at = offset
+            elif event == "resume" and paused_at is not None:
+                paused_milliseconds += offset - paused_at
+                paused_at = None
+            else:
+                ended_by = event
+
+        last_tick = 0
+        for last_tick in telemetry.iter_ticks(record.ticks):
+            pass
+
+        # Pauses keep the rest of the tick, so an on-time phase has no drift
+        drift = last_tick - paused_milliseconds - record.tick_count * 1000
+
+        table.add_row(
+            str(record.phase),
+            str(record.started),
+            str(record.tick_count),
+            str(pauses),
+            f"{paused_milliseconds / 1000:.1f} seconds",
+            f"{drift} ms",
+            ended_by,
+        )
+
+    click.clear()
+    console.rule("[bold]Focus Telemetry")
+    console.print(table)
+
+
 def main():
     click.clear()
 
@@ -269,6 +337,8 @@ def main():
         show_all_statistics()
     elif option == 3:
         show_today_statistics()
+    elif option == 4:
+        show_phase_telemetry()
 
 
 if __name__ == "__main__":
@@ -1,4 +1,14 @@
-from sqlalchemy import Boolean, Column, DateTime, Integer
+from datetime import datetime
+
+from sqlalchemy import (
+    Boolean,
+    Column,
+    DateTime,
+    ForeignKey,
+    Integer,
+    LargeBinary,
+    String,
+)
 from sqlalchemy.sql import func
 
 from .config import Base
@@ -36,3 +46,39 @@ class Pomodoro(Base):
         self.minutes_per_short_break = minutes_per_short_break
         self.minutes_per_long_break = minutes_per_long_break
         self.rounds_per_session = rounds_per_session
+
+
+class PhaseTelemetry(Base):
+    """
+    SQLAlchemy model for the per phase telemetry of a pomodoro.
+
+    ticks and events hold varint encoded blobs, see tickify.pomodoro.telemetry
+    """
+
+    __tablename__ = "phase_telemetry"
+
+    id = Column(Integer, primary_key=True, index=True)
+    pomodoro_id = Column(
+        Integer, ForeignKey("pomodoros.id"), nullable=False, index=True
+    )
+    phase = Column(String, nullable=False)
+    started = Column(DateTime(timezone=True), nullable=False)
+    tick_count = Column(Integer, nullable=False)
+    ticks = Column(LargeBinary, nullable=False)
+    events = Column(LargeBinary, nullable=False)
+
+    def __init__(
+        self,
+        pomodoro_id: int,
+        phase: str,
+        started: datetime,
+        tick_count: int,
+        ticks: bytes,
+        events: bytes,
+    ):
+        self.pomodoro_id = pomodoro_id
+        self.phase = phase
+        self.started = started
+        self.tick_count = tick_count
+        self.ticks = ticks
+        self.events = events
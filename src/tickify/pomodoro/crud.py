@@ -1,9 +1,9 @@
-from datetime import date
+from datetime import date, datetime
 
 from sqlalchemy.sql import func
 
 from tickify.db.config import SessionLocal
-from tickify.db.models import Pomodoro
+from tickify.db.models import PhaseTelemetry, Pomodoro
 
 
 def add_new_record(
@@ -91,3 +91,45 @@ def get_todays_records():
         )
 
     return records
+
+
+def add_phase_telemetry(
+    pomodoro_id: int,
+    phase: str,
+    started: datetime,
+    tick_count: int,
+    ticks: bytes,
+    events: bytes,
+):
+    """
+    Store the encoded telemetry of a single phase of a pomodoro.
+    """
+
+    telemetry = PhaseTelemetry(
+        pomodoro_id=pomodoro_id,
+        phase=phase,
+        started=started,
+        tick_count=tick_count,
+        ticks=ticks,
+        events=events,
+    )
+
+    with SessionLocal() as session:
+        session.add(telemetry)
+        session.commit()
+
+
+def get_phase_telemetry(pomodoro_id: int):
+    """
+    Fetch the telemetry of every phase of a pomodoro, in the order they ran.
+    """
+
+    with SessionLocal() as session:
+        records = (
+            session.query(PhaseTelemetry)
+            .filter(PhaseTelemetry.pomodoro_id == pomodoro_id)
+            .order_by(PhaseTelemetry.id)
+            .all()
+        )
+
+    return records
@@ -0,0 +1,151 @@
+import os
+import selectors
+import sys
+import threading
+from typing import Callable, Optional
+
+try:
+    import termios
+    import tty
+except ImportError:  # Windows
+    termios = None  # type: ignore
+    tty = None  # type: ignore
+
+try:
+    from pynput import keyboard as pynput_keyboard
+except ImportError:
+    pynput_keyboard = None  # type: ignore
+
+# Global hotkeys need modifiers, bare letters would fire while typing elsewhere
+global_hotkeys = {
+    "p": "<ctrl>+<alt>+p",
+    "b": "<ctrl>+<alt>+b",
+    "s": "<ctrl>+<alt>+s",
+}
+
+
+class KeyboardController:
+    """
+    Deliver single key presses to a callback while the timer is running.
+
+    The default backend puts stdin in cbreak mode and waits on it with a
+    selector in a background thread, so keys arrive without enter and without
+    polling. When stdin is not a terminal (or termios is unavailable), pynput
+    is used as a global hotkey backend if it is installed, bound to the
+    modifier combos in global_hotkeys.
+    """
+
+    def __init__(self, on_key: Callable[[str], None], backend: str = "auto") -> None:
+        """
+        backend: auto, stdin, pynput or none
+        """
+        self.on_key = on_key
+        self.backend = self._resolve_backend(backend)
+        self._thread: Optional[threading.Thread] = None
+        self._listener = None
+        self._saved_attributes = None
+        self._wake_read: Optional[int] = None
+        self._wake_write: Optional[int] = None
+
+    def _resolve_backend(self, backend: str) -> str:
+        if backend != "auto":
+            return backend
+
+        if termios is not None and sys.stdin.isatty():
+            return "stdin"
+
+        if pynput_keyboard is not None:
+            return "pynput"
+
+        return "none"
+
+    def get_key_label(self, char: str) -> Optional[str]:
+        """
+        The key or combo the user has to press to send char, None when there
+        is no keyboard backend.
+        """
+        if self.backend == "pynput":
+            return global_hotkeys[char]
+
+        if self.backend == "none":
+            return None
+
+        return char
+
+    def start(self) -> None:
+        if self.backend == "stdin":
+            self._start_stdin()
+        elif self.backend == "pynput":
+            self._start_pynput()
+
+    def stop(self) -> None:
+        if self.backend == "stdin":
+            self._stop_stdin()
+        elif self.backend == "pynput":
+            self._stop_pynput()
+
+    def _start_stdin(self) -> None:
+        fd = sys.stdin.fileno()
+        self._saved_attributes = termios.tcgetattr(fd)
+        tty.setcbreak(fd)
+
+        # Self-pipe so stop() can wake the selector instantly
+        self._wake_read, self._wake_write = os.pipe()
+
+        self._thread = threading.Thread(
+            target=self._read_stdin, args=(fd,), name="tickify-keyboard", daemon=True
+        )
+        self._thread.start()
+
+    def _read_stdin(self, fd: int) -> None:
+        with selectors.DefaultSelector() as selector:
+            selector.register(fd, selectors.EVENT_READ)
+            selector.register(self._wake_read, selectors.EVENT_READ)  # type: ignore
+
+            while True:
+                for key, _ in selector.select():
+                    if key.fd == self._wake_read:
+                        return
+
+                    data = os.read(fd, 32)
+                    if not data:
+                        return
+
+                    for char in data.decode(errors="ignore"):
+                        self.on_key(char)
+
+    def _stop_stdin(self) -> None:
+        if self._thread is not None:
+            os.write(self._wake_write, b"\0")  # type: ignore
+            self._thread.join()
+            self._thread = None
+
+            os.close(self._wake_read)  # type: ignore
+            os.close(self._wake_write)  # type: ignore
+
+        if self._saved_attributes is not None:
+            termios.tcsetattr(
+                sys.stdin.fileno(), termios.TCSADRAIN, self._saved_attributes
+            )
+            self._saved_attributes = None
+
+    def _start_pynput(self) -> None:
+        self._listener = pynput_keyboard.GlobalHotKeys(
+            {
+                hotkey: (lambda char=char: self.on_key(char))
+                for char, hotkey in global_hotkeys.items()
+            }
+        )
+        self._listener.start()
+
+    def _stop_pynput(self) -> None:
+        if self._listener is not None:
+            self._listener.stop()
+            self._listener = None
+
+    def __enter__(self) -> "KeyboardController":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
@@ -1,14 +1,18 @@
 from pathlib import Path
 import subprocess
+import threading
 import time
+from typing import Optional
 
 import click
 from playsound import playsound
 from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TimeElapsedColumn
+from rich.progress import Progress, SpinnerColumn, TaskID, TimeElapsedColumn
 import typer
 
-from tickify.pomodoro import crud
+from tickify.pomodoro import crud, telemetry
+from tickify.pomodoro.keyboard import KeyboardController
+from tickify.pomodoro.telemetry import PhaseRecorder
 
 console = Console()
 
@@ -33,6 +37,7 @@ class Pomodoro:
         session_minutes: int,
         short_break_minutes: int,
         long_break_minutes: int,
+        record_telemetry: bool = False,
     ) -> None:
         self.pomodoro_sessions = pomodoros
         self.session_rounds = session_rounds
@@ -45,6 +50,13 @@ class Pomodoro:
         self.elasped_short_break_seconds = 0
         self.elasped_long_break_seconds = 0
         self.run_pomodoro = True
+        self.record_telemetry = record_telemetry
+        self.record_id: Optional[int] = None
+        self.skip_break = False
+        self.stop_pomodoro = False
+        # Notified on every key press so the timer wakes up immediately
+        self.wakeup = threading.Condition()
+        self.keyboard = KeyboardController(self.handle_key)
 
     def show_alert(
         self, message: str, urgency: str = "normal"
@@ -57,32 +69,132 @@ class Pomodoro:
     def get_seconds(self, time_in_minutes: int) -> int:
         return time_in_minutes * 60
 
-    def on_press(self, key):
+    def handle_key(self, char: str) -> None:
         """
-        Method to listen for key presses while the application is running
+        Apply a help key and wake up the running timer.
         """
-        try:
-            if key.char == "p":
+        with self.wakeup:
+            if char == "p":
                 self.run_pomodoro = not self.run_pomodoro
-        except AttributeError:
-            pass
+            elif char == "b":
+                self.skip_break = True
+            elif char == "s":
+                self.stop_pomodoro = True
+            else:
+                return
 
-    def on_release(self, key):
-        pass
+            self.wakeup.notify_all()
+
+    def run_timer(
+        self,
+        phase: str,
+        description: str,
+        total_seconds: int,
+        skippable: bool = False,
+    ) -> bool:
+        """
+        Count down total_seconds, sleeping on the wakeup condition between ticks.
+
+        Returns True if the timer ran to completion.
+        """
+        recorder = PhaseRecorder(phase) if self.record_telemetry else None
 
-    def start_session(self) -> None:
         with Progress(
             SpinnerColumn(), TimeElapsedColumn(), *Progress.get_default_columns()
         ) as progress:
-            task1 = progress.add_task(
-                f"[bold yellow]Round {self.completed_rounds + 1} ...",
-                total=self.get_seconds(self.session_minutes),
-            )
+            task1 = progress.add_task(description, total=total_seconds)
+
+            with self.wakeup:
+                completed = self.count_down(
+                    progress, task1, description, total_seconds, skippable, recorder
+                )
+
+                # Keys pressed between phases are kept, a pause or skip used
+                # up by this phase must not carry over into the next one
+                self.run_pomodoro = True
+                self.skip_break = False
+
+        if recorder is not None:
+            self.save_telemetry(recorder)
+
+        return completed
+
+    def count_down(
+        self,
+        progress: Progress,
+        task1: TaskID,
+        description: str,
+        total_seconds: int,
+        skippable: bool,
+        recorder: Optional[PhaseRecorder],
+    ) -> bool:
+        """
+        The tick loop of run_timer, must be called holding the wakeup condition.
+        """
+        elapsed = 0
+        deadline = time.monotonic() + 1
+
+        while elapsed < total_seconds:
+            if self.stop_pomodoro or (skippable and self.skip_break):
+                if recorder is not None:
+                    recorder.event(
+                        telemetry.STOP if self.stop_pomodoro else telemetry.SKIP
+                    )
+                return False
+
+            if not self.run_pomodoro:
+                # Keep the part of the tick left over, then block until a key arrives
+                remaining = max(deadline - time.monotonic(), 0)
+                progress.update(task1, description=f"{description} [bold red](paused)")
+                if recorder is not None:
+                    recorder.event(telemetry.PAUSE)
+
+                self.wakeup.wait_for(
+                    lambda: self.run_pomodoro
+                    or self.stop_pomodoro
+                    or (skippable and self.skip_break)
+                )
+
+                progress.update(task1, description=description)
+                if recorder is not None and self.run_pomodoro:
+                    recorder.event(telemetry.RESUME)
+                deadline = time.monotonic() + remaining
+                continue
+
+            timeout = deadline - time.monotonic()
+            if timeout > 0:
+                self.wakeup.wait(timeout)
+                continue
+
+            elapsed += 1
+            deadline += 1
+            progress.update(task1, advance=1)
+            if recorder is not None:
+                recorder.tick()
+
+        return True
+
+    def save_telemetry(self, recorder: PhaseRecorder) -> None:
+        ticks, events = recorder.get_blobs()
+
+        crud.add_phase_telemetry(
+            pomodoro_id=self.record_id,  # type: ignore
+            phase=recorder.phase,
+            started=recorder.started,
+            tick_count=len(recorder.tick_offsets),
+            ticks=ticks,
+            events=events,
+        )
 
-            while not progress.finished:
-                if self.run_pomodoro:
-                    progress.update(task1, advance=1)
-                    time.sleep(1)
+    def start_session(self) -> None:
+        completed = self.run_timer(
+            "round",
+            f"[bold yellow]Round {self.completed_rounds + 1} ...",
+            self.get_seconds(self.session_minutes),
+        )
+
+        if not completed:
+            return
 
         self.completed_rounds += 1
 
@@ -90,31 +202,29 @@ class Pomodoro:
         console.print(f"[bold green]Round {self.completed_rounds} Completed.\n")
 
     def start_short_break(self) -> None:
-        with Progress(
-            SpinnerColumn(), TimeElapsedColumn(), *Progress.get_default_columns()
-        ) as progress:
-            task1 = progress.add_task(
-                f"Short Break ...", total=self.get_seconds(self.short_break_minutes)
-            )
+        self.run_timer(
+            "short-break",
+            f"Short Break ...",
+            self.get_seconds(self.short_break_minutes),
+            skippable=True,
+        )
 
-            while not progress.finished:
-                progress.update(task1, advance=1)
-                time.sleep(1)
+        if self.stop_pomodoro:
+            return
 
         self.show_alert("Short Break Over!! Get Back to Work.", urgency="critical")
         console.print(f"[bold green]Short Break Over\n")
 
     def start_long_break(self) -> None:
-        with Progress(
-            SpinnerColumn(), TimeElapsedColumn(), *Progress.get_default_columns()
-        ) as progress:
-            task1 = progress.add_task(
-                f"Long Break ...", total=self.get_seconds(self.long_break_minutes)
-            )
+        self.run_timer(
+            "long-break",
+            f"Long Break ...",
+            self.get_seconds(self.long_break_minutes),
+            skippable=True,
+        )
 
-            while not progress.finished:
-                progress.update(task1, advance=1)
-                time.sleep(1)
+        if self.stop_pomodoro:
+            return
 
         self.show_alert("Long Break Completed.")
         console.print(f"[bold green]Long Break Over.\n")
@@ -126,10 +236,21 @@ class Pomodoro:
         console.print("[bold green]ALL SESSIONS HAVE BEEN COMPLETED\n")
 
     def display_round_help_keys(self) -> None:
+        pause_key = self.keyboard.get_key_label("p")
+        stop_key = self.keyboard.get_key_label("s")
+        skip_key = self.keyboard.get_key_label("b")
+
+        if pause_key is None:
+            console.print(
+                "[bold]Help Keys[/bold] \n[bold red]unavailable:[/bold red] "
+                "[bold]no keyboard input, run in a terminal or install tickify\\[hotkeys][/bold]\n"
+            )
+            return
+
         console.print(
-            "[bold]Help Keys[/bold] \n[bold red]p:[/bold red] "
-            "[bold]pause / resume round[/bold]\n[bold red]s:[/bold red] [bold]stop round[/bold]\n"
-            "[bold red]b:[/bold red] [bold]skip break[/bold]\n"
+            f"[bold]Help Keys[/bold] \n[bold red]{pause_key}:[/bold red] "
+            f"[bold]pause / resume round[/bold]\n[bold red]{stop_key}:[/bold red] [bold]stop pomodoro[/bold]\n"
+            f"[bold red]{skip_key}:[/bold red] [bold]skip break[/bold]\n"
         )
 
     def reset_completed_rounds(self) -> None:
@@ -153,16 +274,32 @@ class Pomodoro:
             minutes_per_long_break=self.long_break_minutes,
             rounds_per_session=self.session_rounds,
         )
+        self.record_id = record.id  # type: ignore
 
-        for pomodoro_session_count in range(self.pomodoro_sessions):
-            # listener = keyboard.Listener(on_press=self.on_press)
-            # listener.start()
+        with self.keyboard:
+            self.run_sessions(record.id)  # type: ignore
+
+        if self.stop_pomodoro:
+            console.rule("[bold red]POMODORO STOPPED")
+            return
+
+        # After all sessions, update done and ended
+        crud.update_done_status(id=record.id)  # type: ignore
+
+        console.rule("[bold green]ALL POMODORO SESSIONS COMPLETED")
+        self.show_alert("All pomodoro sessions completed successfully.")
+
+        console.print("[bold red]Press any to quit ...")
+        input()
+        typer.Exit()
 
+    def run_sessions(self, record_id: int) -> None:
+        for pomodoro_session_count in range(self.pomodoro_sessions):
             click.clear()
             console.rule(
                 f"[bold green]Pomodoro Session {pomodoro_session_count + 1} out of {self.pomodoro_sessions}"
             )
-            # self.display_round_help_keys()
+            self.display_round_help_keys()
 
             while self.completed_rounds < self.session_rounds:
                 if self.completed_rounds == 0:
@@ -176,20 +313,26 @@ class Pomodoro:
 
                 self.start_session()
 
+                if self.stop_pomodoro:
+                    return
+
                 # Update the databe, and change the completed rounds
-                crud.update_record_rounds(id=record.id)  # type: ignore
+                crud.update_record_rounds(id=record_id)
 
                 # Sound the short break bell only n - 1 times
                 if self.completed_rounds <= self.session_rounds - 1:
                     self.play_sound(sound_files["short-break"])
                     self.start_short_break()
 
+                    if self.stop_pomodoro:
+                        return
+
                     self.play_sound(sound_files["work"])
 
             self.completed_sessions += 1
 
             # After all round, update the total sessions count
-            crud.update_record_total_sessions(id=record.id)  # type: ignore
+            crud.update_record_total_sessions(id=record_id)
 
             self.reset_completed_rounds()
             self.display_rounds_complete_message()
@@ -199,15 +342,8 @@ class Pomodoro:
                 self.play_sound(sound_files["long-break"])
                 self.start_long_break()
 
-        # After all sessions, update done and ended
-        crud.update_done_status(id=record.id)  # type: ignore
-
-        console.rule("[bold green]ALL POMODORO SESSIONS COMPLETED")
-        self.show_alert("All pomodoro sessions completed successfully.")
-
-        console.print("[bold red]Press any to quit ...")
-        input()
-        typer.Exit()
+                if self.stop_pomodoro:
+                    return
 
     def __str__(self) -> str:
         return f"Pomodoro Timer {self.session_minutes}"
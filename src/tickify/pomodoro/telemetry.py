@@ -0,0 +1,139 @@
+from array import array
+from datetime import datetime, timezone
+import time
+from typing import Iterator, Tuple
+
+# Expected gap between two ticks, ticks are stored as their drift from this
+TICK_MILLISECONDS = 1000
+
+PAUSE = 1
+RESUME = 2
+SKIP = 3
+STOP = 4
+
+event_names = {
+    PAUSE: "pause",
+    RESUME: "resume",
+    SKIP: "skip",
+    STOP: "stop",
+}
+
+
+def encode_varint(value: int, buffer: bytearray) -> None:
+    """
+    Append a zigzag encoded signed integer to buffer as a varint.
+    """
+    value = (value << 1) ^ (value >> 63)
+
+    while value > 0x7F:
+        buffer.append((value & 0x7F) | 0x80)
+        value >>= 7
+
+    buffer.append(value)
+
+
+def iter_varints(blob: bytes) -> Iterator[int]:
+    """
+    Lazily decode the zigzag varints written by encode_varint.
+    """
+    value = 0
+    shift = 0
+
+    for byte in blob:
+        value |= (byte & 0x7F) << shift
+        shift += 7
+
+        if not byte & 0x80:
+            yield (value >> 1) ^ -(value & 1)
+            value = 0
+            shift = 0
+
+
+def encode_ticks(offsets: array) -> bytes:
+    """
+    Encode tick offsets (milliseconds since the phase started) as the drift
+    of each gap from TICK_MILLISECONDS, so an on-time tick costs one byte.
+    """
+    buffer = bytearray()
+    previous = 0
+
+    for offset in offsets:
+        encode_varint(offset - previous - TICK_MILLISECONDS, buffer)
+        previous = offset
+
+    return bytes(buffer)
+
+
+def iter_ticks(blob: bytes) -> Iterator[int]:
+    """
+    Yield tick offsets in milliseconds since the phase started.
+    """
+    offset = 0
+
+    for drift in iter_varints(blob):
+        offset += drift + TICK_MILLISECONDS
+        yield offset
+
+
+def encode_events(offsets: array, codes: array) -> bytes:
+    """
+    Encode state changes as (milliseconds since the previous event, code) pairs.
+    """
+    buffer = bytearray()
+    previous = 0
+
+    for offset, code in zip(offsets, codes):
+        encode_varint(offset - previous, buffer)
+        encode_varint(code, buffer)
+        previous = offset
+
+    return bytes(buffer)
+
+
+def iter_events(blob: bytes) -> Iterator[Tuple[int, str]]:
+    """
+    Yield (milliseconds since the phase started, event name) pairs.
+
+    A truncated blob stops at the last complete event, unknown codes are
+    yielded as their number.
+    """
+    values = iter_varints(blob)
+    offset = 0
+
+    for delta in values:
+        code = next(values, None)
+        if code is None:
+            return
+
+        offset += delta
+        yield offset, event_names.get(code, str(code))
+
+
+class PhaseRecorder:
+    """
+    Collect the ticks and state changes of one phase in compact arrays.
+    """
+
+    def __init__(self, phase: str) -> None:
+        self.phase = phase
+        self.started = datetime.now(timezone.utc)
+        self.start_time = time.monotonic()
+        self.tick_offsets = array("q")
+        self.event_offsets = array("q")
+        self.event_codes = array("B")
+
+    def get_offset(self) -> int:
+        return round((time.monotonic() - self.start_time) * 1000)
+
+    def tick(self) -> None:
+        self.tick_offsets.append(self.get_offset())
+
+    def event(self, code: int) -> None:
+        self.event_offsets.append(self.get_offset())
+        self.event_codes.append(code)
+
+    def get_blobs(self) -> Tuple[bytes, bytes]:
+        return (
+            encode_ticks(self.tick_offsets),
+            encode_events(self.event_offsets, self.event_codes),
+        )
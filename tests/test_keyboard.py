@@ -0,0 +1,47 @@
+import os
+import queue
+import sys
+
+import pytest
+
+from tickify.pomodoro.keyboard import KeyboardController
+
+termios = pytest.importorskip("termios")
+pty = pytest.importorskip("pty")
+
+
+@pytest.fixture
+def terminal(monkeypatch):
+    master, slave = pty.openpty()
+    stdin = os.fdopen(slave, "r")
+    monkeypatch.setattr(sys, "stdin", stdin)
+
+    yield master, slave
+
+    stdin.close()
+    os.close(master)
+
+
+def test_stdin_backend_delivers_keys_and_restores_terminal(terminal):
+    master, slave = terminal
+    attributes = termios.tcgetattr(slave)
+    keys = queue.Queue()
+
+    controller = KeyboardController(keys.put)
+    assert controller.backend == "stdin"
+
+    with controller:
+        assert not termios.tcgetattr(slave)[3] & termios.ICANON
+
+        os.write(master, b"pb")
+
+        assert keys.get(timeout=1) == "p"
+        assert keys.get(timeout=1) == "b"
+
+    assert termios.tcgetattr(slave) == attributes
+
+
+def test_no_backend_has_no_key_labels():
+    controller = KeyboardController(lambda char: None, backend="none")
+
+    assert controller.get_key_label("p") is None
@@ -0,0 +1,87 @@
+import threading
+import time
+
+import pytest
+
+from tickify.pomodoro.pomodoro import Pomodoro
+
+
+@pytest.fixture
+def pomodoro():
+    return Pomodoro(
+        pomodoros=1,
+        session_rounds=1,
+        session_minutes=1,
+        short_break_minutes=1,
+        long_break_minutes=1,
+        record_telemetry=False,
+    )
+
+
+def press(pomodoro, char, delay):
+    timer = threading.Timer(delay, pomodoro.handle_key, (char,))
+    timer.start()
+    return timer
+
+
+def run_timed(pomodoro, *args, **kwargs):
+    start = time.monotonic()
+    completed = pomodoro.run_timer(*args, **kwargs)
+    return completed, time.monotonic() - start
+
+
+def test_pause_resume_keeps_rest_of_tick(pomodoro):
+    press(pomodoro, "p", 0.5)
+    press(pomodoro, "p", 1.0)
+
+    completed, elapsed = run_timed(pomodoro, "round", "Round", 2)
+
+    assert completed
+    assert 2.4 < elapsed < 2.8
+
+
+def test_skip_ignored_in_round(pomodoro):
+    press(pomodoro, "b", 0.2)
+
+    completed, elapsed = run_timed(pomodoro, "round", "Round", 1)
+
+    assert completed
+    assert elapsed >= 1
+    assert not pomodoro.skip_break
+
+
+def test_skip_while_paused_ends_break(pomodoro):
+    press(pomodoro, "p", 0.1)
+    press(pomodoro, "b", 0.2)
+
+    completed, elapsed = run_timed(
+        pomodoro, "short-break", "Short Break", 10, skippable=True
+    )
+
+    assert not completed
+    assert elapsed < 1
+    # The next phase must not start paused
+    assert pomodoro.run_pomodoro
+    assert not pomodoro.skip_break
+
+
+def test_skip_pressed_before_break_is_kept(pomodoro):
+    pomodoro.handle_key("b")
+
+    completed, elapsed = run_timed(
+        pomodoro, "short-break", "Short Break", 10, skippable=True
+    )
+
+    assert not completed
+    assert elapsed < 1
+
+
+@pytest.mark.parametrize("skippable", [False, True])
+def test_stop_ends_phase(pomodoro, skippable):
+    press(pomodoro, "s", 0.2)
+
+    completed, elapsed = run_timed(pomodoro, "round", "Round", 10, skippable)
+
+    assert not completed
+    assert elapsed < 1
+    assert pomodoro.stop_pomodoro
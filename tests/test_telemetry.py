@@ -0,0 +1,110 @@
+from array import array
+import threading
+
+from tickify.pomodoro import telemetry
+
+
+def test_ticks_round_trip():
+    offsets = array("q", [1000, 2000, 3000])
+    blob = telemetry.encode_ticks(offsets)
+
+    assert len(blob) == 3
+    assert list(telemetry.iter_ticks(blob)) == list(offsets)
+
+
+def test_ticks_negative_drift():
+    offsets = array("q", [998, 1995, 3001])
+    blob = telemetry.encode_ticks(offsets)
+
+    assert list(telemetry.iter_ticks(blob)) == list(offsets)
+
+
+def test_ticks_pause_length_gap():
+    # A 25 minute pause between two ticks needs a multi-byte varint
+    offsets = array("q", [1000, 1_502_000, 1_503_000])
+    blob = telemetry.encode_ticks(offsets)
+
+    assert len(blob) > 3
+    assert list(telemetry.iter_ticks(blob)) == list(offsets)
+
+
+def test_ticks_empty():
+    assert telemetry.encode_ticks(array("q")) == b""
+    assert list(telemetry.iter_ticks(b"")) == []
+
+
+def test_events_round_trip():
+    offsets = array("q", [1500, 1_501_500, 1_530_000])
+    codes = array("B", [telemetry.PAUSE, telemetry.RESUME, telemetry.SKIP])
+    blob = telemetry.encode_events(offsets, codes)
+
+    assert list(telemetry.iter_events(blob)) == [
+        (1500, "pause"),
+        (1_501_500, "resume"),
+        (1_530_000, "skip"),
+    ]
+
+
+def test_events_empty():
+    assert telemetry.encode_events(array("q"), array("B")) == b""
+    assert list(telemetry.iter_events(b"")) == []
+
+
+def test_events_truncated_blob():
+    offsets = array("q", [1500, 2000])
+    codes = array("B", [telemetry.PAUSE, telemetry.STOP])
+    blob = telemetry.encode_events(offsets, codes)
+
+    assert list(telemetry.iter_events(blob[:-1])) == [(1500, "pause")]
+
+
+def test_events_unknown_code():
+    blob = telemetry.encode_events(array("q", [10]), array("B", [42]))
+
+    assert list(telemetry.iter_events(blob)) == [(10, "42")]
+
+
+def test_phase_recorder_blobs():
+    recorder = telemetry.PhaseRecorder("round")
+    recorder.tick()
+    recorder.event(telemetry.PAUSE)
+    recorder.event(telemetry.RESUME)
+    recorder.tick()
+
+    ticks, events = recorder.get_blobs()
+
+    assert list(telemetry.iter_ticks(ticks)) == list(recorder.tick_offsets)
+    assert [event for _, event in telemetry.iter_events(events)] == [
+        "pause",
+        "resume",
+    ]
+
+
+def test_run_timer_saves_telemetry(monkeypatch):
+    from tickify.pomodoro import crud
+    from tickify.pomodoro.pomodoro import Pomodoro
+
+    saved = []
+    monkeypatch.setattr(crud, "add_phase_telemetry", lambda **row: saved.append(row))
+
+    pomodoro = Pomodoro(1, 1, 1, 1, 1, record_telemetry=True)
+    pomodoro.record_id = 7
+    threading.Timer(1.5, pomodoro.handle_key, ("p",)).start()
+    threading.Timer(2.5, pomodoro.handle_key, ("p",)).start()
+
+    assert pomodoro.run_timer("short-break", "Short Break", 3, skippable=True)
+
+    (row,) = saved
+    assert row["pomodoro_id"] == 7
+    assert row["phase"] == "short-break"
+    assert row["tick_count"] == 3
+
+    ticks = list(telemetry.iter_ticks(row["ticks"]))
+    assert len(ticks) == 3
+    events = list(telemetry.iter_events(row["events"]))
+    assert all(
+        abs(tick - expected) < 100 for tick, expected in zip(ticks, [1000, 3000, 4000])
+    )
+    assert [event for _, event in events] == ["pause", "resume"]
+    assert abs(events[0][0] - 1500) < 100
+    assert abs(events[1][0] - 2500) < 100